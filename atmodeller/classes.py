@@ -37,7 +37,12 @@ from atmodeller.constants import (
 from atmodeller.containers import Parameters, Planet, SolverParameters, SpeciesCollection
 from atmodeller.interfaces import FugacityConstraintProtocol
 from atmodeller.output import Output, OutputDisequilibrium, OutputSolution
-from atmodeller.solvers import get_solver_individual, make_solve_tau_step, repeat_solver
+from atmodeller.solvers import (
+    get_solver,
+    make_solve_tau_step,
+    parallel_repeat_solver,
+    repeat_solver,
+)
 from atmodeller.type_aliases import NpFloat
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -137,11 +142,7 @@ class InteriorAtmosphere:
         )
         # jax.debug.print("base_solution_array = {out}", out=base_solution_array)
 
-        self._solver = get_solver_individual(parameters)
-        # Alternative: solve the entire batch with a single root-finding call. This approach is
-        # less flexible because it doesn't allow inspecting the solution for each individual
-        # system.
-        # self._solver = get_solver_batch(parameters)
+        self._solver = get_solver(parameters)
 
         # First solution attempt. A good initial guess might find solutions for all cases.
         logger.info(f"Attempting to solve {parameters.batch_size} model(s)")
@@ -238,9 +239,16 @@ class InteriorAtmosphere:
                 max_attempts: int = jnp.max(solver_attempts).item()
 
             else:
-                solution, solver_status_, solver_steps_, solver_attempts = repeat_solver(
-                    self._solver, solution, parameters, subkey
-                )
+                if parameters.solver_parameters.multistart_parallel:
+                    solution, solver_status_, solver_steps_, solver_attempts = (
+                        parallel_repeat_solver(
+                            self._solver, solution, solver_status, parameters, subkey
+                        )
+                    )
+                else:
+                    solution, solver_status_, solver_steps_, solver_attempts = repeat_solver(
+                        self._solver, solution, parameters, subkey
+                    )
                 max_attempts = jnp.max(solver_attempts).item()
                 # Since tau is unaltered, the first multistart just repeats the first calculation,
                 # which we already know has some failed cases. So we minus one for the reporting.
@@ -26,10 +26,9 @@ import jax.numpy as jnp
 import lineax as lx
 import numpy as np
 import optimistix as optx
-from jax import lax
 from jaxmod.constants import AVOGADRO, GRAVITATIONAL_CONSTANT
 from jaxmod.units import unit_conversion
-from jaxmod.utils import as_j64, get_batch_size, partial_rref, to_hashable
+from jaxmod.utils import as_j64, get_batch_size, partial_rref
 from jaxtyping import Array, ArrayLike, Bool, Float, Float64
 from lineax import AbstractLinearSolver
 from molmass import Formula
@@ -582,27 +581,16 @@ class FugacityConstraints(eqx.Module):
         Returns:
             Log fugacity
         """
-        # NOTE: Must avoid the late-binding closure issue
-        fugacity_funcs: list[Callable] = [
-            to_hashable(constraint.log_fugacity) for constraint in self.constraints
-        ]
-        # jax.debug.print("fugacity_funcs = {out}", out=fugacity_funcs)
-
-        # Temperature must be a float array to ensure branches have have identical types
+        # Temperature must be a float array to ensure constraints have identical types
         temperature = as_j64(temperature)
 
-        def apply_fugacity(index: ArrayLike, temperature: ArrayLike, pressure: ArrayLike) -> Array:
-            # jax.debug.print("index = {out}", out=index)
-            return lax.switch(
-                index,
-                fugacity_funcs,
-                temperature,
-                pressure,
-            )
-
-        indices: Array = jnp.arange(len(self.constraints))
-        vmap_fugacity: Callable = eqx.filter_vmap(apply_fugacity, in_axes=(0, None, None))
-        log_fugacity: Array = vmap_fugacity(indices, temperature, pressure)
+        # Each constraint is only required for its own species, so evaluate each constraint once
+        # rather than dispatching with lax.switch, which under vmap evaluates every constraint for
+        # every species.
+        log_fugacity_list: list[Array] = [
+            constraint.log_fugacity(temperature, pressure) for constraint in self.constraints
+        ]
+        log_fugacity: Array = jnp.stack(jnp.broadcast_arrays(*log_fugacity_list))
         # jax.debug.print("log_fugacity = {out}", out=log_fugacity)
 
         return log_fugacity
@@ -803,7 +791,15 @@ class SolverParameters(eqx.Module):
             Can be either ``fwd`` or ``bwd``. Defaults to ``fwd``.
         multistart: Number of multistarts. Defaults to ``10``.
         multistart_perturbation: Perturbation for multistart. Defaults to ``30``.
+        multistart_parallel: Whether to solve all multistart attempts at once rather than
+            sequentially. Defaults to ``False``.
         tau: Tau factor for species stability. Defaults to :const:`~atmodeller.constants.TAU`.
+        batch_solver: Whether to solve each system in a batch with an individual root-finding call
+            (``individual``), the entire batch with a single root-finding call (``batch``), or each
+            system individually in sequential chunks of ``map_batch_size`` systems (``map``).
+            Defaults to ``individual``.
+        map_batch_size: Number of systems solved at once when ``batch_solver`` is ``map``.
+            Defaults to ``1``.
     """
 
     solver: type[OptxSolver] = optx.Newton
@@ -829,8 +825,51 @@ class SolverParameters(eqx.Module):
     """Number of multistarts"""
     multistart_perturbation: float = 30.0
     """Perturbation for multistart"""
+    multistart_parallel: bool = False
+    """Whether to solve all multistart attempts at once rather than sequentially
+
+    Solving all attempts at once stacks them along the batch axis, which removes the sequential
+    dependency between attempts but always solves the maximum number of attempts. This does not
+    apply to systems with species' stability, which must step through tau sequentially. It cannot
+    be combined with a ``batch`` solver, because a single attempt with a non-finite or singular
+    Jacobian would then fail the root-find for every system, and the shared convergence status
+    could not distinguish the attempts.
+    """
     tau: Array = eqx.field(converter=as_j64, default=TAU)  # NOTE: Must be an array to trace tau
     """Tau factor for species stability"""
+    batch_solver: Literal["individual", "batch", "map"] = "individual"
+    """Whether to solve each system in a batch individually, the entire batch at once, or each
+    system individually in sequential chunks
+
+    Solving the entire batch at once evaluates the residual of all systems natively batched in a
+    single root-finding call, which can be faster for small batches of cheap systems. However, the
+    Jacobian of the whole batch is factorised as one dense matrix, so the cost of the linear solve
+    grows rapidly with batch size and a non-finite or singular Jacobian for one system fails the
+    solve for all systems. The convergence status and number of steps are shared by all systems in
+    the batch.
+
+    Solving in sequential chunks with :func:`jax.lax.map` only materialises the intermediate arrays
+    for ``map_batch_size`` systems at a time, which reduces peak memory for large batches or
+    expensive real gas EOS at the expense of run time.
+    """
+    map_batch_size: int = 1
+    """Number of systems solved at once when ``batch_solver`` is ``map``"""
+
+    def __check_init__(self) -> None:
+        """Checks the solver parameters are valid and compatible
+
+        Raises:
+            ValueError: If the map batch size is less than one, or if a parallel multistart is
+                combined with a batch solver
+        """
+        if self.map_batch_size < 1:
+            raise ValueError(f"map_batch_size must be at least 1, but is {self.map_batch_size}")
+
+        if self.multistart_parallel and self.batch_solver == "batch":
+            raise ValueError(
+                "multistart_parallel cannot be combined with batch_solver='batch' because a "
+                "failed attempt would fail the root-find for every system"
+            )
 
     def get_solver_instance(self) -> OptxSolver:
         return self.solver(
@@ -247,21 +247,14 @@ def get_log_activity_pure_species(
     total_pressure: Float[Array, ""] = get_total_pressure(parameters, log_number_density)
     # jax.debug.print("total_pressure = {out}", out=total_pressure)
 
-    activity_funcs: list[Callable] = [
-        to_hashable(species_.activity.log_activity) for species_ in species
+    # Each activity is only required for its own species, so evaluate each activity once rather
+    # than dispatching with lax.switch, which under vmap evaluates every activity for every species.
+    log_activity_list: list[Array] = [
+        species_.activity.log_activity(temperature, total_pressure) for species_ in species
     ]
-
-    def apply_activity(index: ArrayLike) -> Float[Array, ""]:
-        return lax.switch(
-            index,
-            activity_funcs,
-            temperature,
-            total_pressure,
-        )
-
-    indices: Integer[Array, " species"] = jnp.arange(len(species))
-    vmap_activity: Callable = eqx.filter_vmap(apply_activity, in_axes=(0,))
-    log_activity_pure_species: Float[Array, " species"] = vmap_activity(indices)
+    log_activity_pure_species: Float[Array, " species"] = jnp.stack(
+        jnp.broadcast_arrays(*log_activity_list)
+    )
     # jax.debug.print("log_activity_pure_species = {out}", out=log_activity_pure_species)
 
     return log_activity_pure_species
@@ -475,26 +468,15 @@ def get_species_ppmw_in_melt(
     total_pressure: Float[Array, ""] = get_total_pressure(parameters, log_number_density)
     diatomic_oxygen_fugacity: Float[Array, ""] = jnp.take(fugacity, diatomic_oxygen_index)
 
-    # NOTE: All solubility formulations must return a JAX array to allow vmap
-    solubility_funcs: list[Callable] = [
-        to_hashable(species_.solubility.jax_concentration) for species_ in species
-    ]
-
-    def apply_solubility(
-        index: Integer[Array, ""], fugacity: Float[Array, ""]
-    ) -> Float[Array, ""]:
-        return lax.switch(
-            index,
-            solubility_funcs,
-            fugacity,
-            temperature,
-            total_pressure,
-            diatomic_oxygen_fugacity,
+    # NOTE: All solubility formulations must return a JAX array to allow stacking. As for the
+    # activity, each solubility is only evaluated once for its own species.
+    species_ppmw_list: list[Array] = [
+        species_.solubility.jax_concentration(
+            fugacity[ii], temperature, total_pressure, diatomic_oxygen_fugacity
         )
-
-    indices: Integer[Array, " species"] = jnp.arange(len(species))
-    vmap_solubility: Callable = eqx.filter_vmap(apply_solubility, in_axes=(0, 0))
-    species_ppmw: Float[Array, " species"] = vmap_solubility(indices, fugacity)
+        for ii, species_ in enumerate(species)
+    ]
+    species_ppmw: Float[Array, " species"] = jnp.stack(jnp.broadcast_arrays(*species_ppmw_list))
     # jax.debug.print("ppmw = {out}", out=ppmw)
 
     return species_ppmw
@@ -28,7 +28,7 @@
         print(fugacity)
 """
 
-from atmodeller.eos._chabrier import get_chabrier_eos_models
+from atmodeller.eos._chabrier import CHABRIER_INTEGRATION_STEPS, get_chabrier_eos_models
 from atmodeller.eos._holland_powell import get_holland_eos_models
 from atmodeller.eos._holley import get_holley_eos_models
 from atmodeller.eos._reid_connolly import get_reid_connolly_eos_models
@@ -39,13 +39,20 @@ from atmodeller.eos._zhang_duan import get_zhang_eos_models
 from atmodeller.eos.core import RealGas
 
 
-def get_eos_models() -> dict[str, RealGas]:
+def get_eos_models(
+    chabrier_integration_steps: int = CHABRIER_INTEGRATION_STEPS,
+) -> dict[str, RealGas]:
     """Gets a dictionary of EOS models
 
+    Args:
+        chabrier_integration_steps: Number of integration steps for the fugacity of the
+            :cite:t:`CD21` models. Defaults to
+            :data:`~atmodeller.eos._chabrier.CHABRIER_INTEGRATION_STEPS`.
+
     Returns:
         Dictionary of EOS models
     """
-    eos_models = get_chabrier_eos_models()
+    eos_models = get_chabrier_eos_models(chabrier_integration_steps)
     eos_models |= get_holley_eos_models()
     eos_models |= get_holland_eos_models()
     eos_models |= get_reid_connolly_eos_models()
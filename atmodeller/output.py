@@ -21,7 +21,6 @@ import pickle
 from pathlib import Path
 from typing import Optional
 
-import jax.numpy as jnp
 import numpy as np
 import pandas as pd
 from jaxmod.constants import GAS_CONSTANT
@@ -68,7 +67,7 @@ class OutputDisequilibrium(Output):
             Reaction disequilibrium as a dictionary
         """
         reaction_mask: NpBool = self.reaction_mask()
-        residual: NpFloat = np.asarray(self.vmapf.objective_function(jnp.asarray(self.solution)))
+        residual: NpFloat = np.asarray(self.vmapf.objective_function(self._solution_array))
 
         # Number of True entries per row (must be same for all rows)
         n_cols: NpInt = reaction_mask.sum(axis=1)[0]
@@ -60,6 +60,11 @@ class Output:
         self.log_stability: NpFloat = np.where(
             parameters.species.active_stability, log_stability, np.nan
         )
+        # Keep the solution on the device to avoid a host to device transfer for every output
+        self._solution_array: Array = jnp.asarray(solution)
+        self._log_number_density_array: Array = self._solution_array[
+            :, : self.log_number_density.shape[1]
+        ]
         # Caching output to avoid recomputation
         self._cached_dict: Optional[dict[str, dict[str, NpArray]]] = None
         self._cached_dataframes: Optional[dict[str, pd.DataFrame]] = None
@@ -219,7 +224,7 @@ class Output:
             Log molar mass of the atmosphere
         """
         atmosphere_log_molar_mass: Array = self.vmapf.get_atmosphere_log_molar_mass(
-            jnp.asarray(self.log_number_density)
+            self._log_number_density_array
         )
 
         return np.asarray(atmosphere_log_molar_mass)
@@ -239,7 +244,7 @@ class Output:
             Log volume of the atmosphere
         """
         atmosphere_log_volume: Array = self.vmapf.get_atmosphere_log_volume(
-            jnp.asarray(self.log_number_density)
+            self._log_number_density_array
         )
 
         return np.asarray(atmosphere_log_volume)
@@ -258,7 +263,7 @@ class Output:
         Returns:
             Total pressure
         """
-        total_pressure: Array = self.vmapf.get_total_pressure(jnp.asarray(self.log_number_density))
+        total_pressure: Array = self.vmapf.get_total_pressure(self._log_number_density_array)
 
         return np.asarray(total_pressure)
 
@@ -351,7 +356,7 @@ class Output:
         """
         condensed_species_mask: NpFloat = np.where(self.condensed_species_mask, 1.0, np.nan)
         element_density: Array = self.vmapf.get_element_density(
-            jnp.asarray(self.log_number_density) * condensed_species_mask
+            self._log_number_density_array * condensed_species_mask
         )
 
         return np.asarray(element_density)
@@ -363,7 +368,7 @@ class Output:
             Number density of elements dissolved in melt due to species solubility
         """
         element_density_dissolved: Array = self.vmapf.get_element_density_in_melt(
-            jnp.asarray(self.log_number_density)
+            self._log_number_density_array
         )
 
         return np.asarray(element_density_dissolved)
@@ -376,7 +381,7 @@ class Output:
         """
         gas_species_mask: NpFloat = np.where(self.gas_species_mask, 1.0, np.nan)
         element_density: Array = self.vmapf.get_element_density(
-            jnp.asarray(self.log_number_density) * gas_species_mask,
+            self._log_number_density_array * gas_species_mask,
         )
 
         return np.asarray(element_density)
@@ -507,7 +512,7 @@ class Output:
         Returns:
             Log activity without stability
         """
-        log_activity: Array = self.vmapf.get_log_activity(jnp.asarray(self.log_number_density))
+        log_activity: Array = self.vmapf.get_log_activity(self._log_number_density_array)
 
         return np.asarray(log_activity)
 
@@ -546,7 +551,7 @@ class Output:
             Pressure of species in bar
         """
         pressure: Array = self.vmapf.get_pressure_from_log_number_density(
-            jnp.asarray(self.log_number_density)
+            self._log_number_density_array
         )
 
         return np.asarray(pressure)
@@ -562,11 +567,13 @@ class Output:
         """
         out: dict[str, ArrayLike] = {}
 
+        # Compute once for all species because activity evaluates the EOS of every species
+        pressure: NpFloat = self.pressure()
+        activity: NpFloat = self.activity()
+
         for nn, species_ in enumerate(self.species):
-            pressure: NpArray = self.pressure()[:, nn]
-            activity: NpArray = self.activity()[:, nn]
-            out[species_.name] = pressure
-            out[f"{species_.name}_activity"] = activity
+            out[species_.name] = pressure[:, nn]
+            out[f"{species_.name}_activity"] = activity[:, nn]
 
         return {key: np.squeeze(value) for key, value in out.items()}
 
@@ -597,7 +604,7 @@ class Output:
         Returns:
             Dictionary of the residual
         """
-        residual: Array = self.vmapf.objective_function(jnp.asarray(self.solution))
+        residual: Array = self.vmapf.objective_function(self._solution_array)
 
         out: dict[int, NpArray] = {}
         for ii in range(residual.shape[1]):
@@ -612,7 +619,7 @@ class Output:
             Species number density in the melt
         """
         species_density_in_melt: Array = self.vmapf.get_species_density_in_melt(
-            jnp.asarray(self.log_number_density)
+            self._log_number_density_array
         )
 
         return np.asarray(species_density_in_melt)
@@ -624,7 +631,7 @@ class Output:
             Species ppmw in the melt
         """
         species_ppmw_in_melt: Array = self.vmapf.get_species_ppmw_in_melt(
-            jnp.asarray(self.log_number_density)
+            self._log_number_density_array
         )
 
         return np.asarray(species_ppmw_in_melt)
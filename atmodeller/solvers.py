@@ -21,6 +21,8 @@ and batched systems of non-linear equations. The solvers are designed to integra
 JAX transformations support Equinox-based pytrees for flexible parameter handling.
 """
 
+import functools
+import logging
 from collections.abc import Callable
 from typing import cast
 
@@ -30,11 +32,13 @@ import jax.numpy as jnp
 import optimistix as optx
 from jax import lax, random
 from jaxmod.utils import vmap_axes_spec
-from jaxtyping import Array, Bool, Float, Integer, PRNGKeyArray
+from jaxtyping import Array, Bool, Float, Integer, PRNGKeyArray, PyTree
 
 from atmodeller.containers import Parameters
 from atmodeller.engine import objective_function
 
+logger: logging.Logger = logging.getLogger(__name__)
+
 LOG_NUMBER_DENSITY_VMAP_AXES: int = 0
 
 
@@ -77,6 +81,14 @@ def solver_single(
     return solution, status, steps
 
 
+traced_solver_single: Callable = eqx.debug.assert_max_traces(solver_single, max_traces=None)
+"""Counts the traces of :func:`solver_single` without a limit
+
+The solvers are built from this so that :func:`equinox.debug.get_num_traces` can check that the
+compiled solvers are reused.
+"""
+
+
 def get_solver_individual(parameters: Parameters) -> Callable:
     """Gets a vmapped, JIT-compiled solver for independent batch systems.
 
@@ -84,20 +96,113 @@ def get_solver_individual(parameters: Parameters) -> Callable:
     that it can solve multiple independent systems in a batch efficiently. Each batch element is
     solved separately, producing per-element convergence statistics.
 
+    The solver only depends on ``parameters`` through its ``vmap`` axes, which are hashable and
+    compare equal for separately constructed but otherwise identical species and constraints. The
+    solver is therefore cached on the axes so that such systems share the same compiled solver.
+
     Args:
         parameters: Model parameters required by the objective function and solver
 
     Returns:
         Callable
     """
-    solver_fn: Callable = eqx.Partial(solver_single, objective_function=objective_function)
+    return _get_solver_individual(vmap_axes_spec(parameters))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_solver_individual(parameters_vmap_axes: Parameters) -> Callable:
+    """Gets a vmapped, JIT-compiled solver for independent batch systems.
+
+    Args:
+        parameters_vmap_axes: ``vmap`` axes of the model parameters
+
+    Returns:
+        Callable
+    """
+    logger.debug("Building solver for new parameters vmap axes")
+    solver_fn: Callable = eqx.Partial(traced_solver_single, objective_function=objective_function)
 
     return eqx.filter_jit(
-        eqx.filter_vmap(
-            solver_fn, in_axes=(LOG_NUMBER_DENSITY_VMAP_AXES, vmap_axes_spec(parameters))
-        )
+        eqx.filter_vmap(solver_fn, in_axes=(LOG_NUMBER_DENSITY_VMAP_AXES, parameters_vmap_axes))
+    )
+
+
+def get_solver(parameters: Parameters) -> Callable:
+    """Gets the solver for the batch.
+
+    The solver is selected by :attr:`~atmodeller.containers.SolverParameters.batch_solver`.
+
+    Args:
+        parameters: Model parameters required by the objective function and solver
+
+    Returns:
+        Callable
+    """
+    if parameters.solver_parameters.batch_solver == "batch":
+        return get_solver_batch(parameters)
+
+    if parameters.solver_parameters.batch_solver == "map":
+        return get_solver_map(parameters)
+
+    return get_solver_individual(parameters)
+
+
+def get_solver_map(parameters: Parameters) -> Callable:
+    """Gets a JIT-compiled solver for independent batch systems solved in sequential chunks.
+
+    This is equivalent to :func:`get_solver_individual`, except that :func:`jax.lax.map` solves
+    :attr:`~atmodeller.containers.SolverParameters.map_batch_size` systems at a time rather than
+    vectorising over the entire batch. This reduces peak memory at the expense of run time.
+
+    As for :func:`get_solver_individual`, the solver is cached on the ``vmap`` axes of
+    ``parameters``.
+
+    Args:
+        parameters: Model parameters required by the objective function and solver
+
+    Returns:
+        Callable
+    """
+    return _get_solver_map(vmap_axes_spec(parameters), parameters.solver_parameters.map_batch_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_solver_map(parameters_vmap_axes: Parameters, map_batch_size: int) -> Callable:
+    """Gets a JIT-compiled solver for independent batch systems solved in sequential chunks.
+
+    Args:
+        parameters_vmap_axes: ``vmap`` axes of the model parameters
+        map_batch_size: Number of systems to solve at once
+
+    Returns:
+        Callable
+    """
+    logger.debug("Building map solver for new parameters vmap axes")
+    solver_fn: Callable = eqx.Partial(traced_solver_single, objective_function=objective_function)
+
+    # Unlike vmap, lax.map requires every mapped leaf to be batched, so batched leaves of the
+    # parameters are mapped over and the remainder are closed over.
+    batched_filter: PyTree[bool] = jax.tree.map(
+        lambda axis: axis is not None, parameters_vmap_axes, is_leaf=lambda x: x is None
     )
 
+    @eqx.filter_jit
+    def solver(
+        solution: Array, parameters: Parameters
+    ) -> tuple[Float[Array, " batch solution"], Bool[Array, " batch"], Integer[Array, " batch"]]:
+        batched_parameters, unbatched_parameters = eqx.partition(parameters, batched_filter)
+
+        def solve_one(
+            xs: tuple[Float[Array, " solution"], Parameters],
+        ) -> tuple[Float[Array, " solution"], Bool[Array, ""], Integer[Array, ""]]:
+            solution_, batched_parameters_ = xs
+
+            return solver_fn(solution_, eqx.combine(batched_parameters_, unbatched_parameters))
+
+        return lax.map(solve_one, (solution, batched_parameters), batch_size=map_batch_size)
+
+    return solver
+
 
 def get_solver_batch(parameters: Parameters) -> Callable:
     """Gets a JIT-compiled solver for batched systems treated as a single problem.
@@ -106,17 +211,34 @@ def get_solver_batch(parameters: Parameters) -> Callable:
     :func:`solver_single` sees the batch as one system. The solver returns a single convergence
     status and iteration count, which are broadcast to match the batch shape.
 
+    As for :func:`get_solver_individual`, the solver is cached on the ``vmap`` axes of
+    ``parameters``.
+
     Args:
         parameters: Model parameters required by the objective function and solver
 
     Returns:
         Callable
     """
+    return _get_solver_batch(vmap_axes_spec(parameters))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_solver_batch(parameters_vmap_axes: Parameters) -> Callable:
+    """Gets a JIT-compiled solver for batched systems treated as a single problem.
+
+    Args:
+        parameters_vmap_axes: ``vmap`` axes of the model parameters
+
+    Returns:
+        Callable
+    """
+    logger.debug("Building batch solver for new parameters vmap axes")
     objective_vmap: Callable = eqx.filter_vmap(
         objective_function,
-        in_axes=(LOG_NUMBER_DENSITY_VMAP_AXES, vmap_axes_spec(parameters)),
+        in_axes=(LOG_NUMBER_DENSITY_VMAP_AXES, parameters_vmap_axes),
     )
-    solver_fn: Callable = eqx.Partial(solver_single, objective_function=objective_vmap)
+    solver_fn: Callable = eqx.Partial(traced_solver_single, objective_function=objective_vmap)
 
     @eqx.filter_jit
     def solver(
@@ -280,6 +402,158 @@ def repeat_solver(
     return final_solution, final_status, final_steps, final_success_attempt
 
 
+def parallel_repeat_solver(
+    solver_fn: Callable,
+    initial_guess: Float[Array, "batch solution"],
+    initial_status: Bool[Array, " batch"],
+    parameters: Parameters,
+    key: PRNGKeyArray,
+) -> tuple[
+    Float[Array, "batch solution"],
+    Bool[Array, " batch"],
+    Integer[Array, " batch"],
+    Integer[Array, " batch"],
+]:
+    """Multistart solver that solves all perturbations at once.
+
+    This is the parallel counterpart of :func:`repeat_solver`. Rather than retrying the failed
+    entries one attempt at a time, the entries that failed to converge from the initial guess are
+    gathered and :attr:`~atmodeller.containers.SolverParameters.multistart` perturbed copies of
+    each are stacked along the batch axis and solved in a single call of ``solver_fn``. The
+    perturbation is applied proportionally to
+    :attr:`~atmodeller.containers.SolverParameters.multistart_perturbation`. For each failed entry
+    the converged attempt with the smallest residual norm is selected without branching and the
+    results are scattered back into the batch. Entries that already converged are kept as-is.
+
+    As for :func:`repeat_solver`, attempt 1 is the solve from the initial guess, so the perturbed
+    attempts are numbered from 2.
+
+    This avoids the sequential dependency between attempts at the expense of always solving every
+    attempt for the failed entries, so it is best suited to a high failure rate. The stacked batch
+    size depends on the number of failed entries, so a different number of failures compiles the
+    solver again.
+
+    Args:
+        solver_fn: Solver function
+        initial_guess: Initial guess for the solution
+        initial_status: Whether each entry converged from the initial guess
+        parameters: Model parameters required by the objective function and solver
+        key: A JAX random key for generating perturbations
+
+    Returns:
+        tuple:
+            - final_solution: Array of solution values
+            - final_status: Boolean scalar indicating whether the solver converged
+            - final_steps: Integer scalar giving the number of iterations performed
+            - final_attempts: Success attempts
+    """
+    multistart: int = parameters.solver_parameters.multistart
+    batch_size, solution_size = initial_guess.shape
+
+    final_solution: Float[Array, "batch solution"] = initial_guess
+    final_status: Bool[Array, " batch"] = initial_status
+    final_steps: Integer[Array, " batch"] = jnp.zeros(batch_size, dtype=int)
+    final_success_attempt: Integer[Array, " batch"] = initial_status.astype(int)
+
+    # This function is not jitted so the failed entries can be gathered with a concrete size
+    failed_indices: Integer[Array, " failed"] = jnp.nonzero(~initial_status)[0]
+    number_failed: int = failed_indices.size
+    if number_failed == 0:
+        return final_solution, final_status, final_steps, final_success_attempt
+
+    raw_perturb: Float[Array, "multistart failed solution"] = random.uniform(
+        key, shape=(multistart, number_failed, solution_size), minval=-1.0, maxval=1.0
+    )
+    initial_solutions: Float[Array, "multistart failed solution"] = (
+        initial_guess[failed_indices]
+        + parameters.solver_parameters.multistart_perturbation * raw_perturb
+    )
+
+    # Stack the attempts along the batch axis, which requires the batched parameters of the failed
+    # entries to be gathered and tiled
+    gather_and_tile: Callable = lambda x, axis: (  # noqa: E731
+        x if axis is None else jnp.tile(x[failed_indices], (multistart,) + (1,) * (x.ndim - 1))
+    )
+    tiled_parameters: Parameters = jax.tree.map(
+        gather_and_tile, parameters, vmap_axes_spec(parameters), is_leaf=lambda x: x is None
+    )
+    tiled_parameters = eqx.tree_at(
+        lambda p: p.batch_size, tiled_parameters, multistart * number_failed
+    )
+
+    solution, status, steps = solver_fn(
+        initial_solutions.reshape(multistart * number_failed, solution_size), tiled_parameters
+    )
+    # The tiled parameters are batched along the same axes as the parameters
+    residual_norm: Float[Array, " multistart_failed"] = _get_residual_norm(
+        vmap_axes_spec(parameters)
+    )(solution, tiled_parameters)
+
+    solution = solution.reshape(multistart, number_failed, solution_size)
+    status = status.reshape(multistart, number_failed)
+    steps = steps.reshape(multistart, number_failed)
+    residual_norm = residual_norm.reshape(multistart, number_failed)
+
+    selected: Integer[Array, " failed"] = _select_attempt(status, residual_norm)
+    failed_solution: Float[Array, "failed solution"] = jnp.take_along_axis(
+        solution, selected[None, :, None], axis=0
+    )[0]
+    failed_status: Bool[Array, " failed"] = jnp.any(status, axis=0)
+    failed_steps: Integer[Array, " failed"] = jnp.take_along_axis(steps, selected[None], axis=0)[0]
+    failed_solution = cast(
+        Array,
+        jnp.where(failed_status[:, None], failed_solution, initial_guess[failed_indices]),
+    )
+    # Attempt 1 is the solve from the initial guess
+    failed_success_attempt: Integer[Array, " failed"] = jnp.where(failed_status, selected + 2, 0)
+
+    final_solution = final_solution.at[failed_indices].set(failed_solution)
+    final_status = final_status.at[failed_indices].set(failed_status)
+    final_steps = final_steps.at[failed_indices].set(failed_steps)
+    final_success_attempt = final_success_attempt.at[failed_indices].set(failed_success_attempt)
+
+    return final_solution, final_status, final_steps, final_success_attempt
+
+
+def _select_attempt(
+    status: Bool[Array, "multistart batch"], residual_norm: Float[Array, "multistart batch"]
+) -> Integer[Array, " batch"]:
+    """Selects the converged attempt with the smallest residual norm for each entry.
+
+    Args:
+        status: Whether each attempt converged
+        residual_norm: Residual norm of each attempt
+
+    Returns:
+        Index of the selected attempt, which is the first attempt if no attempt converged
+    """
+    return jnp.argmin(jnp.where(status, residual_norm, jnp.inf), axis=0)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_residual_norm(parameters_vmap_axes: Parameters) -> Callable:
+    """Gets a JIT-compiled function for the residual norm of each system in a batch.
+
+    Args:
+        parameters_vmap_axes: ``vmap`` axes of the model parameters
+
+    Returns:
+        Callable
+    """
+    objective_vmap: Callable = eqx.filter_vmap(
+        objective_function,
+        in_axes=(LOG_NUMBER_DENSITY_VMAP_AXES, parameters_vmap_axes),
+    )
+
+    @eqx.filter_jit
+    def residual_norm(solution: Array, parameters: Parameters) -> Float[Array, " batch"]:
+        residual: Float[Array, " batch residual"] = objective_vmap(solution, parameters)
+
+        return jax.vmap(parameters.solver_parameters.norm)(residual)
+
+    return residual_norm
+
+
 def make_solve_tau_step(solver_fn: Callable, parameters: Parameters) -> Callable:
     """Factory function that creates a JIT-compiled solver step for a sequence of tau values.
 
@@ -17,6 +17,7 @@
 """Utilities for tests"""
 
 import logging
+from typing import Optional
 
 # NOTE: Don't import anything from Atmodeller otherwise beartype can't wrap the tests for runtime
 # type checking
@@ -27,6 +28,9 @@ from jaxtyping import ArrayLike
 
 logger: logging.Logger = logging.getLogger("atmodeller.tests")
 
+JAX_COMPILATION_CACHE_MAX_SIZE: int = 256 * 1024**2
+"""Maximum size of the JAX compilation cache in bytes, which requires ``filelock`` to evict"""
+
 
 class Helper:
     """Helper for integral tests"""
@@ -56,21 +60,20 @@ class Helper:
             True if the solution is close to the target, otherwise False
         """
         # Find the intersection of keys
-        intersection_keys: set[str] = solution.keys() & target.keys()
+        intersection_keys: list[str] = sorted(solution.keys() & target.keys())
         logger.info("Keys for comparison = %s", intersection_keys)
 
-        # Create new dictionaries with the intersecting keys
-        solution_compare: dict[str, ArrayLike] = {key: solution[key] for key in intersection_keys}
-        target_compare: dict[str, ArrayLike] = {key: target[key] for key in intersection_keys}
-
-        target_values: npt.NDArray[np.float64] = np.array(
-            list(dict(sorted(target_compare.items())).values())
+        # Flatten and concatenate in key order so that a single comparison covers all the values,
+        # regardless of whether individual values are scalars or batched
+        target_values: npt.NDArray[np.float64] = np.concatenate(
+            [np.ravel(target[key]) for key in intersection_keys]
         )
         logger.debug("target_values = %s", target_values)
-        solution_values: npt.NDArray[np.float64] = np.array(
-            list(dict(sorted(solution_compare.items())).values())
+        solution_values: npt.NDArray[np.float64] = np.concatenate(
+            [np.ravel(solution[key]) for key in intersection_keys]
         )
         logger.debug("solution_values = %s", solution_values)
+
         if log:
             target_values = np.log10(target_values)
             solution_values = np.log10(solution_values)
@@ -83,6 +86,45 @@ class Helper:
         return isclose.all()
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """Persists compiled XLA executables in the pytest cache between test sessions
+
+    An existing cache directory, for example set by ``JAX_COMPILATION_CACHE_DIR``, takes
+    precedence.
+    """
+    import jax
+
+    # The cache is not available if the cacheprovider plugin is disabled
+    cache: Optional[pytest.Cache] = getattr(config, "cache", None)
+    if cache is None or jax.config.jax_compilation_cache_dir is not None:
+        return
+
+    cache_dir: str = str(cache.mkdir("jax_cc"))
+    logger.info("JAX compilation cache directory = %s", cache_dir)
+    jax.config.update("jax_compilation_cache_dir", cache_dir)
+    # The tests compile many small functions, which by default are too quick to be cached
+    jax.config.update("jax_persistent_cache_min_compile_time_secs", 0)
+    jax.config.update("jax_persistent_cache_min_entry_size_bytes", 0)
+    # Evict the least recently used executables so the cache does not grow as the code changes
+    jax.config.update("jax_compilation_cache_max_size", JAX_COMPILATION_CACHE_MAX_SIZE)
+
+
 @pytest.fixture
 def helper():
     return Helper()
+
+
+@pytest.fixture(scope="session")
+def eos_models():
+    """EOS models shared by all tests in the session"""
+    from atmodeller.eos import get_eos_models
+
+    return get_eos_models()
+
+
+@pytest.fixture(scope="session")
+def solubility_models():
+    """Solubility models shared by all tests in the session"""
+    from atmodeller.solubility import get_solubility_models
+
+    return get_solubility_models()
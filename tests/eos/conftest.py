@@ -24,7 +24,7 @@ import pytest
 from jaxmod.utils import as_j64
 from jaxtyping import Array, ArrayLike
 
-from atmodeller.eos import RealGas, get_eos_models
+from atmodeller.eos import RealGas
 
 # logger: logging.Logger = debug_logger()
 # logger.setLevel(logging.INFO)
@@ -37,10 +37,14 @@ ATOL: float = 1.0e-8
 
 
 class CheckValues:
-    """Helper class with methods to check and confirm values"""
+    """Helper class with methods to check and confirm values
 
-    def __init__(self) -> None:
-        self._eos_models: dict[str, RealGas] = get_eos_models()
+    Args:
+        eos_models: EOS models
+    """
+
+    def __init__(self, eos_models: dict[str, RealGas]) -> None:
+        self._eos_models: dict[str, RealGas] = eos_models
 
     @classmethod
     def _check_property(
@@ -159,5 +163,5 @@ class CheckValues:
 
 
 @pytest.fixture(scope="module")
-def check_values():
-    return CheckValues()
+def check_values(eos_models):
+    return CheckValues(eos_models)
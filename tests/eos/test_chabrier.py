@@ -16,14 +16,30 @@
 #
 """Tests for the EOS models from :cite:t:`CD21`"""
 
+from pathlib import Path
+
+import pytest
 from jaxmod.units import unit_conversion
 
 from atmodeller.eos import RealGas
+from atmodeller.eos._chabrier import Chabrier
 
 MODEL_SUFFIX: str = "chabrier21"
 """Suffix of the :cite:t:`CD21` models"""
 
 
+@pytest.fixture(scope="module")
+def H2_tabulated() -> RealGas:
+    """H2 model with a precomputed fugacity coefficient"""
+    return Chabrier.create(Path("TABLE_H_TP_v1"), tabulate=True)
+
+
+@pytest.fixture(scope="module")
+def H2_mixed() -> RealGas:
+    """H2 model with mixed precision numerical integration"""
+    return Chabrier.create(Path("TABLE_H_TP_v1"), precision="mixed")
+
+
 def test_H2_volume_100kbar(check_values) -> None:
     """Tests volume at 100 kbar"""
     expected: float = 9.005066169376918
@@ -66,3 +82,62 @@ def test_fugacity_with_broadcasting(check_values) -> None:
     """Tests volume with broadcasting"""
     model: RealGas = check_values.get_eos_model("H2", MODEL_SUFFIX)
     check_values.check_broadcasting("fugacity", model)
+
+
+def test_H2_tabulated_fugacity_coefficient_100kbar(check_values, H2_tabulated) -> None:
+    """Tests fugacity coefficient at 100 kbar with a precomputed fugacity coefficient"""
+    # 32.836425 with 20000 integration steps
+    expected: float = 32.840874
+    check_values.fugacity_coefficient(3000, 100e3, H2_tabulated, expected, rtol=1e-6)
+
+
+def test_H2_tabulated_fugacity_coefficient_1000kbar(check_values, H2_tabulated) -> None:
+    """Tests fugacity coefficient at 1000 kbar with a precomputed fugacity coefficient"""
+    # 450897.559856 with 20000 integration steps
+    expected: float = 451111.124405
+    check_values.fugacity_coefficient(5000, 1000e3, H2_tabulated, expected, rtol=1e-6)
+
+
+def test_tabulated_fugacity_with_broadcasting(check_values, H2_tabulated) -> None:
+    """Tests fugacity with broadcasting with a precomputed fugacity coefficient"""
+    check_values.check_broadcasting("fugacity", H2_tabulated)
+
+
+def test_H2_mixed_fugacity_coefficient_100kbar(check_values, H2_mixed) -> None:
+    """Tests fugacity coefficient at 100 kbar with mixed precision"""
+    # Same as test_H2_fugacity_coefficient_100kbar, to within single precision integration
+    expected: float = 33.741562
+    check_values.fugacity_coefficient(3000, 100e3, H2_mixed, expected, rtol=1e-4)
+
+
+def test_H2_mixed_fugacity_coefficient_1000kbar(check_values, H2_mixed) -> None:
+    """Tests fugacity coefficient at 1000 kbar with mixed precision"""
+    # Same as test_H2_fugacity_coefficient_1000kbar, to within single precision integration
+    expected: float = 482475.388584
+    check_values.fugacity_coefficient(5000, 1000e3, H2_mixed, expected, rtol=1e-4)
+
+
+def test_mixed_fugacity_with_broadcasting(check_values, H2_mixed) -> None:
+    """Tests fugacity with broadcasting with mixed precision"""
+    check_values.check_broadcasting("fugacity", H2_mixed)
+
+
+def test_tabulate_pressure_range() -> None:
+    """Tests that the tabulated pressure range must bracket the standard pressure"""
+    with pytest.raises(ValueError):
+        Chabrier.create(Path("TABLE_H_TP_v1")).tabulate(log10_pressure_range=(1.0, 8.0))
+
+
+@pytest.mark.parametrize("integration_steps", (200, 500, 1000))
+def test_H2_fugacity_coefficient_convergence(check_values, integration_steps) -> None:
+    """Tests the convergence of the fugacity coefficient with the number of integration steps"""
+    # 32.836425 with 20000 integration steps
+    expected: float = 32.836425
+    model: RealGas = Chabrier.create(Path("TABLE_H_TP_v1"), integration_steps)
+    default_model: RealGas = check_values.get_eos_model("H2", MODEL_SUFFIX)
+
+    error: float = abs(float(model.fugacity_coefficient(3000, 100e3)) - expected)
+    default_error: float = abs(float(default_model.fugacity_coefficient(3000, 100e3)) - expected)
+
+    # Trapezoid integration converges at second order
+    assert error < 1.2 * default_error * (100 / integration_steps) ** 2
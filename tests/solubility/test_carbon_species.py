@@ -25,7 +25,6 @@ from jaxtyping import ArrayLike
 
 from atmodeller import debug_logger
 from atmodeller.interfaces import RedoxBufferProtocol
-from atmodeller.solubility import get_solubility_models
 from atmodeller.solubility.core import Solubility
 from atmodeller.thermodata import IronWustiteBuffer
 
@@ -56,10 +55,8 @@ logger.info("TEST_PRESSURE_GPA = %e bar", TEST_PRESSURE_GPA)
 logger.info("TEST_FO2 = %e bar", TEST_FO2)
 logger.info("TEST_FO2_GPA = %e bar", TEST_FO2_GPA)
 
-solubility_models: dict[str, Solubility] = get_solubility_models()
 
-
-def test_CH4_basalt_ardia(check_values) -> None:
+def test_CH4_basalt_ardia(check_values, solubility_models) -> None:
     """Tests CH4 in haplobasalt (Fe-free) silicate melt :cite:p:`AHW13`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -79,7 +76,7 @@ def test_CH4_basalt_ardia(check_values) -> None:
     )
 
 
-def test_CO_basalt_armstrong(check_values) -> None:
+def test_CO_basalt_armstrong(check_values, solubility_models) -> None:
     """Tests volatiles in mafic melts under reduced conditions :cite:p:`AHS15`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -99,7 +96,7 @@ def test_CO_basalt_armstrong(check_values) -> None:
     )
 
 
-def test_CO_basalt_yoshioka(check_values) -> None:
+def test_CO_basalt_yoshioka(check_values, solubility_models) -> None:
     """Tests carbon in silicate melts :cite:p:`YNN19`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -118,7 +115,7 @@ def test_CO_basalt_yoshioka(check_values) -> None:
     )
 
 
-def test_CO_rhyolite_yoshioka(check_values) -> None:
+def test_CO_rhyolite_yoshioka(check_values, solubility_models) -> None:
     """Tests carbon in silicate melts :cite:p:`YNN19`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -137,7 +134,7 @@ def test_CO_rhyolite_yoshioka(check_values) -> None:
     )
 
 
-def test_CO2_basalt_dixon(check_values) -> None:
+def test_CO2_basalt_dixon(check_values, solubility_models) -> None:
     """Tests CO2 in MORB liquids :cite:p:`DSH95`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
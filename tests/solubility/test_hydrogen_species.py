@@ -24,7 +24,6 @@ from jaxtyping import ArrayLike
 
 from atmodeller import debug_logger
 from atmodeller.interfaces import RedoxBufferProtocol
-from atmodeller.solubility import get_solubility_models
 from atmodeller.solubility.core import Solubility
 from atmodeller.thermodata import IronWustiteBuffer
 
@@ -52,10 +51,8 @@ logger.info("TEST_TEMPERATURE = %e K", TEST_TEMPERATURE)
 logger.info("TEST_PRESSURE = %e bar", TEST_PRESSURE)
 logger.info("TEST_FO2 = %e bar", TEST_FO2)
 
-solubility_models: dict[str, Solubility] = get_solubility_models()
 
-
-def test_H2_andesite_hirschmann(check_values) -> None:
+def test_H2_andesite_hirschmann(check_values, solubility_models) -> None:
     """Tests H2 in synthetic andesite :cite:p:`HWA12`.
 
     Reference Parameters (fH2, H2 Conc) from Table 2 Values for Andesite, Experiment 901
@@ -76,7 +73,7 @@ def test_H2_andesite_hirschmann(check_values) -> None:
     )
 
 
-def test_H2_basalt_hirschmann(check_values) -> None:
+def test_H2_basalt_hirschmann(check_values, solubility_models) -> None:
     """Tests H2 in synthetic basalt :cite:p:`HWA12`.
 
     Reference Parameters (fH2, H2 Conc) from Table 2 Values for Basalt, Average of Experiments A697
@@ -98,7 +95,7 @@ def test_H2_basalt_hirschmann(check_values) -> None:
     )
 
 
-def test_H2_silicic_melts_gaillard(check_values) -> None:
+def test_H2_silicic_melts_gaillard(check_values, solubility_models) -> None:
     """Tests Fe-H redox exchange in silicate glasses :cite:p:`GSM03`.
 
     Reference Parameters (fH2 and H2 Conc) from Table 4, No. 29
@@ -119,7 +116,7 @@ def test_H2_silicic_melts_gaillard(check_values) -> None:
     )
 
 
-def test_H2O_ano_dio_newcombe(check_values) -> None:
+def test_H2O_ano_dio_newcombe(check_values, solubility_models) -> None:
     """Tests H2O in anorthite-diopside-eutectic compositions :cite:p:`NBB17`.
 
     Reference Parameters (fH2O and H2O Conc) from Table 2, Experiment AD26
@@ -140,7 +137,7 @@ def test_H2O_ano_dio_newcombe(check_values) -> None:
     )
 
 
-def test_H2O_basalt_dixon(check_values) -> None:
+def test_H2O_basalt_dixon(check_values, solubility_models) -> None:
     """Tests H2O in MORB liquids :cite:p:`DSH95`.
 
     Reference Parameters (fH2O and H2O Conc) from Table 5, fH2O=25 bar
@@ -161,7 +158,7 @@ def test_H2O_basalt_dixon(check_values) -> None:
     )
 
 
-def test_H2O_basalt_mitchell(check_values) -> None:
+def test_H2O_basalt_mitchell(check_values, solubility_models) -> None:
     """Tests H2O in basaltic melt :cite:p:`MGO17`.
 
     Reference Parameters (fH2O and H2O Conc) from Figure 7, Maroon Point from 'This Study'.
@@ -182,7 +179,7 @@ def test_H2O_basalt_mitchell(check_values) -> None:
     )
 
 
-def test_H2O_lunar_glass_newcombe(check_values) -> None:
+def test_H2O_lunar_glass_newcombe(check_values, solubility_models) -> None:
     """Tests H2O in lunar basalt :cite:p:`NBB17`.
 
     Reference Parameters (fH2O and H2O Conc) from Table 2, Average of Experiments LG2 and LG4
@@ -203,7 +200,7 @@ def test_H2O_lunar_glass_newcombe(check_values) -> None:
     )
 
 
-def test_H2O_peridotite_sossi(check_values) -> None:
+def test_H2O_peridotite_sossi(check_values, solubility_models) -> None:
     """Tests H2O in peridotite liquids :cite:p:`STB23`.
 
     Reference Parameters (fH2O and H2O Conc) from Table 1, Sample Per-7, using epsilon_3550 of 5.1.
@@ -25,7 +25,6 @@ from jaxtyping import ArrayLike
 
 from atmodeller import debug_logger
 from atmodeller.interfaces import RedoxBufferProtocol
-from atmodeller.solubility import get_solubility_models
 from atmodeller.solubility.core import Solubility
 from atmodeller.thermodata import IronWustiteBuffer
 
@@ -56,10 +55,8 @@ logger.info("TEST_PRESSURE_GPA = %e bar", TEST_PRESSURE_GPA)
 logger.info("TEST_FO2 = %e bar", TEST_FO2)
 logger.info("TEST_FO2_GPA = %e bar", TEST_FO2_GPA)
 
-solubility_models: dict[str, Solubility] = get_solubility_models()
 
-
-def test_Cl2_ano_dio_for_thomas(check_values) -> None:
+def test_Cl2_ano_dio_for_thomas(check_values, solubility_models) -> None:
     """Tests Cl in silicate melts :cite:p:`TW21`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -78,7 +75,7 @@ def test_Cl2_ano_dio_for_thomas(check_values) -> None:
     )
 
 
-def test_Cl2_basalt_thomas(check_values) -> None:
+def test_Cl2_basalt_thomas(check_values, solubility_models) -> None:
     """Tests Cl in silicate melts :cite:p:`TW21`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -97,7 +94,7 @@ def test_Cl2_basalt_thomas(check_values) -> None:
     )
 
 
-def test_He_basalt(check_values) -> None:
+def test_He_basalt(check_values, solubility_models) -> None:
     """He in tholeittic basalt melt :cite:p:`JWB86`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -116,7 +113,7 @@ def test_He_basalt(check_values) -> None:
     )
 
 
-def test_N2_basalt_bernadou(check_values) -> None:
+def test_N2_basalt_bernadou(check_values, solubility_models) -> None:
     """Tests N2 in basaltic silicate melt :cite:p:`BGF21`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -138,7 +135,7 @@ def test_N2_basalt_bernadou(check_values) -> None:
     )
 
 
-def test_N2_basalt_dasgupta(check_values) -> None:
+def test_N2_basalt_dasgupta(check_values, solubility_models) -> None:
     """Tests N2 in silicate melts :cite:p:`DFP22`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -160,7 +157,7 @@ def test_N2_basalt_dasgupta(check_values) -> None:
     )
 
 
-def test_N2_basalt_libourel(check_values) -> None:
+def test_N2_basalt_libourel(check_values, solubility_models) -> None:
     """Tests N2 in basalt (tholeiitic) magmas :cite:p:`LMH03`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
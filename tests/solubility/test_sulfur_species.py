@@ -25,7 +25,6 @@ from jaxtyping import ArrayLike
 
 from atmodeller import debug_logger
 from atmodeller.interfaces import RedoxBufferProtocol
-from atmodeller.solubility import get_solubility_models
 from atmodeller.solubility.core import Solubility
 from atmodeller.thermodata import IronWustiteBuffer
 
@@ -56,10 +55,8 @@ logger.info("TEST_PRESSURE_GPA = %e bar", TEST_PRESSURE_GPA)
 logger.info("TEST_FO2 = %e bar", TEST_FO2)
 logger.info("TEST_FO2_GPA = %e bar", TEST_FO2_GPA)
 
-solubility_models: dict[str, Solubility] = get_solubility_models()
 
-
-def test_S2_sulfate_andesite_boulliung(check_values) -> None:
+def test_S2_sulfate_andesite_boulliung(check_values, solubility_models) -> None:
     """Tests S as sulfate SO4^2-/S^6+ in andesite :cite:p:`BW22,BW23corr`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -80,7 +77,7 @@ def test_S2_sulfate_andesite_boulliung(check_values) -> None:
     )
 
 
-def test_S2_sulfide_andesite_boulliung(check_values) -> None:
+def test_S2_sulfide_andesite_boulliung(check_values, solubility_models) -> None:
     """Tests S as sulfide (S^2-) in andesite :cite:p:`BW23`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -101,7 +98,7 @@ def test_S2_sulfide_andesite_boulliung(check_values) -> None:
     )
 
 
-def test_S2_andesite_boulliung(check_values) -> None:
+def test_S2_andesite_boulliung(check_values, solubility_models) -> None:
     """Tests S in andesite accounting for both sulfide and sulfate :cite:p:`BW22,BW23corr,BW23`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -119,7 +116,7 @@ def test_S2_andesite_boulliung(check_values) -> None:
     )
 
 
-def test_S2_sulfate_basalt_boulliung(check_values) -> None:
+def test_S2_sulfate_basalt_boulliung(check_values, solubility_models) -> None:
     """Tests S in basalt as sulfate, SO4^2-/S^6+ :cite:p:`BW22,BW23corr`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -140,7 +137,7 @@ def test_S2_sulfate_basalt_boulliung(check_values) -> None:
     )
 
 
-def test_S2_sulfide_basalt_boulliung(check_values) -> None:
+def test_S2_sulfide_basalt_boulliung(check_values, solubility_models) -> None:
     """Tests S in basalt as sulfide (S^2-) :cite:p:`BW23`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -161,7 +158,7 @@ def test_S2_sulfide_basalt_boulliung(check_values) -> None:
     )
 
 
-def test_S2_basalt_boulliung(check_values) -> None:
+def test_S2_basalt_boulliung(check_values, solubility_models) -> None:
     """Tests S in basalt due to sulfide and sulfate :cite:p:`BW22,BW23corr,BW23`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -179,7 +176,7 @@ def test_S2_basalt_boulliung(check_values) -> None:
     )
 
 
-def test_S2_sulfate_trachybasalt_boulliung(check_values) -> None:
+def test_S2_sulfate_trachybasalt_boulliung(check_values, solubility_models) -> None:
     """Tests S as sulfate SO4^2-/S^6+ in trachybasalt :cite:p:`BW22,BW23corr`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -200,7 +197,7 @@ def test_S2_sulfate_trachybasalt_boulliung(check_values) -> None:
     )
 
 
-def test_S2_sulfide_trachybasalt_boulliung(check_values) -> None:
+def test_S2_sulfide_trachybasalt_boulliung(check_values, solubility_models) -> None:
     """Tests S as sulfide (S^2-) in trachybasalt :cite:p:`BW23`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -221,7 +218,7 @@ def test_S2_sulfide_trachybasalt_boulliung(check_values) -> None:
     )
 
 
-def test_S2_trachybasalt_boulliung(check_values) -> None:
+def test_S2_trachybasalt_boulliung(check_values, solubility_models) -> None:
     """Tests S in trachybasalt by sulfide and sulfate dissolution :cite:p:`BW22,BW23corr,BW23`"""
 
     function_name: str = inspect.currentframe().f_code.co_name  # type: ignore
@@ -28,7 +28,6 @@ from atmodeller.classes import InteriorAtmosphere
 from atmodeller.containers import Planet, Species, SpeciesCollection
 from atmodeller.interfaces import FugacityConstraintProtocol, SolubilityProtocol
 from atmodeller.output import Output
-from atmodeller.solubility import get_solubility_models
 from atmodeller.thermodata import IronWustiteBuffer
 from atmodeller.utilities import earth_oceans_to_hydrogen_mass
 
@@ -42,15 +41,13 @@ ATOL: float = 1.0e-8
 TOLERANCE: float = 5.0e-2
 """Tolerance of log output to satisfy comparison with FactSage and FastChem"""
 
-solubility_models: Mapping[str, SolubilityProtocol] = get_solubility_models()
-
 species: SpeciesCollection = SpeciesCollection.create(
     ("H2_g", "H2O_g", "CO_g", "CO2_g", "CH4_g", "O2_g")
 )
 gas_CHO_system: InteriorAtmosphere = InteriorAtmosphere(species)
 
 
-def test_H_and_C(helper) -> None:
+def test_H_and_C(helper, solubility_models: Mapping[str, SolubilityProtocol]) -> None:
     """Tests H2-H2O and CO-CO2 with H2O and CO2 solubility."""
 
     H2O_g: Species = Species.create_gas(
@@ -17,19 +17,28 @@
 """Tests for H-O systems"""
 
 import logging
-from typing import Mapping
+from typing import Callable, Mapping, Optional
 
+import equinox as eqx
+import jax.numpy as jnp
 import numpy as np
-from jaxtyping import ArrayLike
+import pytest
+from jaxtyping import Array, ArrayLike
 
 from atmodeller import __version__, debug_logger
-from atmodeller.classes import InteriorAtmosphere
-from atmodeller.containers import ConstantFugacityConstraint, Planet, Species, SpeciesCollection
+from atmodeller.classes import InteriorAtmosphere, SolverParameters
+from atmodeller.containers import (
+    ConstantFugacityConstraint,
+    Parameters,
+    Planet,
+    Species,
+    SpeciesCollection,
+)
 from atmodeller.interfaces import FugacityConstraintProtocol, SolubilityProtocol
 from atmodeller.output import Output
-from atmodeller.solubility import get_solubility_models
+from atmodeller.solvers import _select_attempt, get_solver_individual, traced_solver_single
 from atmodeller.thermodata import IronWustiteBuffer
-from atmodeller.type_aliases import NpFloat
+from atmodeller.type_aliases import NpFloat, NpInt
 from atmodeller.utilities import earth_oceans_to_hydrogen_mass
 
 logger: logging.Logger = debug_logger()
@@ -42,14 +51,23 @@ ATOL: float = 1.0e-6
 TOLERANCE: float = 5.0e-2
 """Tolerance of log output to satisfy comparison with FactSage and FastChem"""
 
-solubility_models: Mapping[str, SolubilityProtocol] = get_solubility_models()
 
-H2O_g: Species = Species.create_gas("H2O", solubility=solubility_models["H2O_peridotite_sossi23"])
-H2_g: Species = Species.create_gas("H2")
-O2_g: Species = Species.create_gas("O2")
-species: SpeciesCollection = SpeciesCollection((H2O_g, H2_g, O2_g))
+@pytest.fixture(scope="module")
+def species(solubility_models: Mapping[str, SolubilityProtocol]) -> SpeciesCollection:
+    """H2O, H2 and O2 species with H2O solubility"""
+    H2O_g: Species = Species.create_gas(
+        "H2O", solubility=solubility_models["H2O_peridotite_sossi23"]
+    )
+    H2_g: Species = Species.create_gas("H2")
+    O2_g: Species = Species.create_gas("O2")
+
+    return SpeciesCollection((H2O_g, H2_g, O2_g))
 
-gas_HO_system: InteriorAtmosphere = InteriorAtmosphere(species)
+
+@pytest.fixture(scope="module")
+def gas_HO_system(species: SpeciesCollection) -> InteriorAtmosphere:
+    """H-O system that is shared by the tests to reuse the compiled solver"""
+    return InteriorAtmosphere(species)
 
 
 def test_version():
@@ -57,7 +75,64 @@ def test_version():
     assert __version__ == "0.9.2"
 
 
-def test_H2O(helper) -> None:
+def test_solver_is_shared(species, gas_HO_system) -> None:
+    """Tests that identical systems share the same compiled solver"""
+    species_copy: SpeciesCollection = SpeciesCollection(tuple(species))
+    fugacity_constraints: dict[str, FugacityConstraintProtocol] = {"O2_g": IronWustiteBuffer()}
+    mass_constraints: dict[str, ArrayLike] = {"H": earth_oceans_to_hydrogen_mass(1)}
+    parameters: Parameters = Parameters.create(
+        species, fugacity_constraints=fugacity_constraints, mass_constraints=mass_constraints
+    )
+    parameters_copy: Parameters = Parameters.create(
+        species_copy, fugacity_constraints=fugacity_constraints, mass_constraints=mass_constraints
+    )
+    solver: Callable = get_solver_individual(parameters)
+
+    assert solver is get_solver_individual(parameters_copy)
+
+    gas_HO_system.solve(
+        fugacity_constraints=fugacity_constraints, mass_constraints=mass_constraints
+    )
+    num_traces: int = eqx.debug.get_num_traces(traced_solver_single)
+    InteriorAtmosphere(species_copy).solve(
+        fugacity_constraints=fugacity_constraints, mass_constraints=mass_constraints
+    )
+
+    # The solve must go through the traced solver, but the second system must not trace it again
+    assert num_traces > 0
+    assert eqx.debug.get_num_traces(traced_solver_single) == num_traces
+
+
+def test_solver_is_shared_constant_fugacity(species, gas_HO_system) -> None:
+    """Tests that systems differing only in constant fugacity share the same compiled solver"""
+    fugacity_constraints: dict[str, FugacityConstraintProtocol] = {
+        "H2_g": ConstantFugacityConstraint(1.0e-7),
+        "O2_g": IronWustiteBuffer(),
+    }
+    fugacity_constraints_other: dict[str, FugacityConstraintProtocol] = {
+        "H2_g": ConstantFugacityConstraint(1.0e-6),
+        "O2_g": IronWustiteBuffer(),
+    }
+    parameters: Parameters = Parameters.create(species, fugacity_constraints=fugacity_constraints)
+    parameters_other: Parameters = Parameters.create(
+        species, fugacity_constraints=fugacity_constraints_other
+    )
+    solver: Callable = get_solver_individual(parameters)
+
+    assert solver is get_solver_individual(parameters_other)
+
+    gas_HO_system.solve(fugacity_constraints=fugacity_constraints)
+    num_traces: int = eqx.debug.get_num_traces(traced_solver_single)
+    gas_HO_system.solve(fugacity_constraints=fugacity_constraints_other)
+
+    # The solve must go through the traced solver, but the second constant fugacity must not trace
+    # it again
+    assert num_traces > 0
+    assert eqx.debug.get_num_traces(traced_solver_single) == num_traces
+    assert np.isclose(gas_HO_system.output.quick_look()["H2_g"], 1.0e-6)
+
+
+def test_H2O(helper, solubility_models: Mapping[str, SolubilityProtocol]) -> None:
     """Tests a single species (H2O)."""
 
     H2O_g: Species = Species.create_gas(
@@ -113,7 +188,7 @@ def test_H_O(helper) -> None:
     assert helper.isclose(solution, fastchem_result, log=True, rtol=TOLERANCE, atol=TOLERANCE)
 
 
-def test_H_fO2(helper) -> None:
+def test_H_fO2(helper, gas_HO_system) -> None:
     """Tests H2-H2O at the IW buffer with H2O solubility."""
 
     planet: Planet = Planet()
@@ -141,7 +216,7 @@ def test_H_fO2(helper) -> None:
     assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
 
 
-def test_H_fO2_fH2(helper) -> None:
+def test_H_fO2_fH2(helper, gas_HO_system) -> None:
     """Tests H2-H2O at the IW buffer with H2O solubility and mixed fugacity constraints."""
 
     planet: Planet = Planet()
@@ -166,7 +241,7 @@ def test_H_fO2_fH2(helper) -> None:
     assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
 
 
-def test_H_fO2_batch_temperature(helper) -> None:
+def test_H_fO2_batch_temperature(helper, gas_HO_system) -> None:
     """Tests H2-H2O at the IW buffer with H2O solubility for a range of surface temperatures."""
 
     # Number of surface temperatures is different to number of species to test array shapes work.
@@ -218,7 +293,7 @@ def test_H_fO2_batch_temperature(helper) -> None:
     assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
 
 
-def test_H_fO2_batch_fO2_shift(helper) -> None:
+def test_H_fO2_batch_fO2_shift(helper, gas_HO_system) -> None:
     """Tests H2-H2O at the IW buffer with H2O solubility for a range of fO2 shifts."""
 
     planet: Planet = Planet()
@@ -270,17 +345,25 @@ def test_H_fO2_batch_fO2_shift(helper) -> None:
     assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
 
 
-def test_H_fO2_batch_H_mass(helper) -> None:
+# Common to the tests that solve the same range of H masses with different solver options
+H_MASS_BATCH: NpFloat = earth_oceans_to_hydrogen_mass(1) * np.array([1, 10, 100])
+"""Range of H masses in kg"""
+H_MASS_BATCH_TARGET: dict[str, NpFloat] = {
+    "H2O_g": np.array([2.570800742364757e-01, 2.426110356931991e01, 1.610286613431932e03]),
+    "H2_g": np.array([2.491511264610584e-01, 2.351283467393216e01, 1.560621626756960e03]),
+    "O2_g": np.array([8.838513516896038e-08, 8.838513516896038e-08, 8.838513516896102e-08]),
+}
+"""Target for the range of H masses at the IW buffer with H2O solubility"""
+
+
+def test_H_fO2_batch_H_mass(helper, gas_HO_system) -> None:
     """Tests H2-H2O at the IW buffer with H2O solubility for a range of H budgets."""
 
     planet: Planet = Planet()
     fugacity_constraints: dict[str, FugacityConstraintProtocol] = {
         "O2_g": IronWustiteBuffer(),
     }
-    oceans: float = 1
-    h_kg: ArrayLike = earth_oceans_to_hydrogen_mass(oceans)
-    # Set up a range of H masses
-    mass_constraints: dict[str, ArrayLike] = {"H": np.array([h_kg, 10 * h_kg, 100 * h_kg])}
+    mass_constraints: dict[str, ArrayLike] = {"H": H_MASS_BATCH}
 
     gas_HO_system.solve(
         planet=planet,
@@ -290,10 +373,75 @@ def test_H_fO2_batch_H_mass(helper) -> None:
     output: Output = gas_HO_system.output
     solution: dict[str, ArrayLike] = output.quick_look()
 
-    target: dict[str, ArrayLike] = {
-        "H2O_g": np.array([2.570800742364757e-01, 2.426110356931991e01, 1.610286613431932e03]),
-        "H2_g": np.array([2.491511264610584e-01, 2.351283467393216e01, 1.560621626756960e03]),
-        "O2_g": np.array([8.838513516896038e-08, 8.838513516896038e-08, 8.838513516896102e-08]),
+    assert helper.isclose(solution, H_MASS_BATCH_TARGET, rtol=RTOL, atol=ATOL)
+
+
+@pytest.mark.parametrize(
+    "solver_parameters",
+    (
+        SolverParameters(batch_solver="batch"),
+        # Chunks of two systems to also test a remainder chunk
+        SolverParameters(batch_solver="map", map_batch_size=2),
+        # Limited steps such that the first attempt fails for some models
+        SolverParameters(max_steps=12, multistart_parallel=True),
+    ),
+    ids=("batch_solver", "map_solver", "parallel_multistart"),
+)
+def test_H_fO2_batch_H_mass_solver(
+    helper, gas_HO_system, solver_parameters: SolverParameters
+) -> None:
+    """Tests H2-H2O at the IW buffer for a range of H budgets with alternative solvers."""
+
+    fugacity_constraints: dict[str, FugacityConstraintProtocol] = {
+        "O2_g": IronWustiteBuffer(),
     }
+    mass_constraints: dict[str, ArrayLike] = {"H": H_MASS_BATCH}
+    initial_log_number_density: Optional[NpFloat] = None
+    if solver_parameters.multistart_parallel:
+        # A poor initial guess such that the first attempt fails for some models
+        initial_log_number_density = np.array([60.0, 40.0, 20.0])
 
-    assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
+    gas_HO_system.solve(
+        initial_log_number_density=initial_log_number_density,
+        fugacity_constraints=fugacity_constraints,
+        mass_constraints=mass_constraints,
+        solver_parameters=solver_parameters,
+    )
+    output: Output = gas_HO_system.output
+    solution: dict[str, ArrayLike] = output.quick_look()
+
+    assert helper.isclose(solution, H_MASS_BATCH_TARGET, rtol=RTOL, atol=ATOL)
+
+    if solver_parameters.multistart_parallel:
+        attempts: NpInt = output.asdict()["solver"]["attempts"]
+        # The first two models converge on the first attempt and must keep that solution
+        assert np.array_equal(attempts[:2], [1, 1])
+
+
+def test_parallel_multistart_selects_smallest_residual() -> None:
+    """Tests the parallel multistart selects the converged attempt with the smallest residual"""
+    # Attempts are along the first axis and entries along the second
+    status: Array = jnp.array([[False, True, False], [True, True, False], [True, False, False]])
+    residual_norm: Array = jnp.array(
+        [[1.0, 1.0e-8, 1.0], [1.0e-8, 1.0e-7, 1.0], [1.0e-9, 0.0, 1.0]]
+    )
+
+    selected: Array = _select_attempt(status, residual_norm)
+
+    # The later converged attempt is preferred if it has a smaller residual, a failed attempt is
+    # never selected, and the first attempt is the fallback if no attempt converged
+    assert np.array_equal(selected, [2, 0, 0])
+
+
+def test_map_batch_size_rejected() -> None:
+    """Tests the map batch size must be at least one"""
+
+    with pytest.raises(ValueError):
+        SolverParameters(batch_solver="map", map_batch_size=0)
+
+
+def test_parallel_multistart_batch_solver_rejected() -> None:
+    """Tests a parallel multistart cannot be solved as a single batch"""
+
+    with pytest.raises(ValueError):
+        SolverParameters(multistart_parallel=True, batch_solver="batch")
@@ -19,9 +19,11 @@
 import logging
 from typing import Mapping
 
+import jax
+import jax.numpy as jnp
 import numpy as np
 import pytest
-from jaxtyping import ArrayLike
+from jaxtyping import Array, ArrayLike
 
 from atmodeller import debug_logger
 from atmodeller.classes import InteriorAtmosphere, SolverParameters
@@ -31,15 +33,14 @@ from atmodeller.containers import (
     Species,
     SpeciesCollection,
 )
-from atmodeller.eos.library import get_eos_models
 from atmodeller.interfaces import (
     ActivityProtocol,
     FugacityConstraintProtocol,
     SolubilityProtocol,
 )
 from atmodeller.output import Output
-from atmodeller.solubility import get_solubility_models
 from atmodeller.thermodata import IronWustiteBuffer
+from atmodeller.type_aliases import NpFloat
 from atmodeller.utilities import earth_oceans_to_hydrogen_mass
 
 logger: logging.Logger = debug_logger()
@@ -49,21 +50,26 @@ RTOL: float = 1.0e-6
 """Relative tolerance"""
 ATOL: float = 1.0e-6
 """Absolute tolerance"""
+H_KG_PER_OCEAN: float = float(earth_oceans_to_hydrogen_mass(1))
+"""Mass of H in kg in one Earth ocean"""
 
-solubility_models: Mapping[str, SolubilityProtocol] = get_solubility_models()
-eos_models: Mapping[str, ActivityProtocol] = get_eos_models()
 
-H2_g: Species = Species.create_gas("H2", activity=eos_models["H2_chabrier21"])
-H2O_g: Species = Species.create_gas("H2O")
-O2_g: Species = Species.create_gas("O2")
-SiO_g: Species = Species.create_gas("OSi")
-H4Si_g: Species = Species.create_gas("H4Si")
-O2Si_l: Species = Species.create_condensed("O2Si", state="l")
-species: SpeciesCollection = SpeciesCollection((H2_g, H2O_g, O2_g, H4Si_g, SiO_g, O2Si_l))
-subneptune_system: InteriorAtmosphere = InteriorAtmosphere(species)
+@pytest.fixture(scope="module")
+def subneptune_system(eos_models: Mapping[str, ActivityProtocol]) -> InteriorAtmosphere:
+    """H-O-Si system with the H2 EOS from :cite:t:`CD21`"""
+    H2_g: Species = Species.create_gas("H2", activity=eos_models["H2_chabrier21"])
+    H2O_g: Species = Species.create_gas("H2O")
+    O2_g: Species = Species.create_gas("O2")
+    SiO_g: Species = Species.create_gas("OSi")
+    H4Si_g: Species = Species.create_gas("H4Si")
+    O2Si_l: Species = Species.create_condensed("O2Si", state="l")
+    species: SpeciesCollection = SpeciesCollection((H2_g, H2O_g, O2_g, H4Si_g, SiO_g, O2Si_l))
+
+    return InteriorAtmosphere(species)
 
 
-def test_fO2_holley(helper) -> None:
+@pytest.mark.xdist_group("holley")
+def test_fO2_holley(helper, eos_models: Mapping[str, ActivityProtocol]) -> None:
     """Tests a system with the H2 EOS from :cite:t:`HWZ58`"""
 
     H2_g: Species = Species.create_gas("H2", activity=eos_models["H2_beattie_holley58"])
@@ -77,10 +83,8 @@ def test_fO2_holley(helper) -> None:
 
     fugacity_constraints: dict[str, FugacityConstraintProtocol] = {"O2_g": IronWustiteBuffer()}
 
-    oceans: ArrayLike = 1
-    h_kg: ArrayLike = earth_oceans_to_hydrogen_mass(oceans)
     mass_constraints: dict[str, ArrayLike] = {
-        "H": h_kg,
+        "H": H_KG_PER_OCEAN,
     }
 
     interior_atmosphere.solve(
@@ -100,57 +104,108 @@ def test_fO2_holley(helper) -> None:
     assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
 
 
-def test_chabrier_earth(helper) -> None:
-    """Tests a system with the H2 EOS from :cite:t:`CD21`"""
-
-    planet: Planet = Planet(surface_temperature=3400)
-    h_kg: ArrayLike = 0.01 * planet.planet_mass
-    si_kg: ArrayLike = 0.1459 * planet.planet_mass  # Si = 14.59 wt% Kargel & Lewis (1993)
-    o_kg: ArrayLike = h_kg * 10
-    mass_constraints: dict[str, ArrayLike] = {"H": h_kg, "Si": si_kg, "O": o_kg}
-
-    subneptune_system.solve(planet=planet, mass_constraints=mass_constraints)
-    output: Output = subneptune_system.output
-    solution: dict[str, ArrayLike] = output.quick_look()
-
-    target: dict[str, float] = {
-        "H2O_g": 7.253556287801738e03,
-        "H2O_g_activity": 7.253556287801635e03,
-        "H2_g": 1.162520652380062e04,
-        "H2_g_activity": 2.516876841308367e05,
-        "H4Si_g": 6.759146395057408e04,
-        "H4Si_g_activity": 6.759146395057408e04,
-        "O2Si_l": 9.311489514762553e04,
-        "O2Si_l_activity": 1.0,
-        "O2_g": 1.791815879185495e-05,
-        "O2_g_activity": 1.791815879185482e-05,
-        "OSi_g": 6.302402285027329e02,
-        "OSi_g_activity": 6.302402285027240e02,
-    }
-
-    assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
-
-
-def test_chabrier_subNeptune(helper) -> None:
-    """Tests a system with the H2 EOS from :cite:t:`CD21` for a sub-Neptune
+# Surface temperature is common to all the Chabrier cases
+CHABRIER_TEMPERATURE: float = 3400
+"""Surface temperature in K of the :cite:t:`CD21` cases"""
+CHABRIER_H_MASS_FRACTION: float = 0.01
+"""Mass fraction of H in the planet of the :cite:t:`CD21` cases"""
+CHABRIER_SI_MASS_FRACTION: float = 0.1459
+"""Mass fraction of Si in the planet of the :cite:t:`CD21` cases (14.59 wt% Kargel & Lewis, 1993)"""
+earth: Planet = Planet(surface_temperature=CHABRIER_TEMPERATURE)
+subneptune: Planet = Planet(
+    surface_temperature=CHABRIER_TEMPERATURE,
+    planet_mass=4.6 * 5.97224e24,
+    surface_radius=1.5 * 6371000,
+)
 
-    This case effectively saturates the maximum allowable log number density at a value of 70
-    based on the default hypercube that brackets the solution (see LOG_NUMBER_DENSITY_UPPER).
-    This is fine for a test, but this test is not physically realistic because solubilities are
-    ignored, which would greatly lower the pressure and hence the number density.
+# The sub-Neptune cases effectively saturate the maximum allowable log number density at a value
+# of 70 based on the default hypercube that brackets the solution (see LOG_NUMBER_DENSITY_UPPER).
+# This is fine for a test, but these cases are not physically realistic because solubilities are
+# ignored, which would greatly lower the pressure and hence the number density.
+CHABRIER_CASES: dict[str, tuple[Planet, float, dict[str, float]]] = {
+    "earth": (
+        earth,
+        # Ten times the mass of H
+        10 * CHABRIER_H_MASS_FRACTION * float(earth.planet_mass),
+        {
+            "H2O_g": 7.253556287801738e03,
+            "H2O_g_activity": 7.253556287801635e03,
+            "H2_g": 1.162520652380062e04,
+            "H2_g_activity": 2.516876841308367e05,
+            "H4Si_g": 6.759146395057408e04,
+            "H4Si_g_activity": 6.759146395057408e04,
+            "O2Si_l": 9.311489514762553e04,
+            "O2Si_l_activity": 1.0,
+            "O2_g": 1.791815879185495e-05,
+            "O2_g_activity": 1.791815879185482e-05,
+            "OSi_g": 6.302402285027329e02,
+            "OSi_g_activity": 6.302402285027240e02,
+        },
+    ),
+    "subNeptune": (
+        subneptune,
+        6.74717e24,
+        {
+            "H2O_g": 4.295071823974879e05,
+            "H2O_g_activity": 4.295071823974879e05,
+            "H2_g": 2.926773356736283e00,
+            "H2_g_activity": 1.956449985411128e04,
+            "H4Si_g": 7.038499826508187e-04,
+            "H4Si_g_activity": 7.038499826508187e-04,
+            "O2Si_l": 4.497910721606553e05,
+            "O2Si_l_activity": 1.0,
+            "O2_g": 1.039725511931324e01,
+            "O2_g_activity": 1.039725511931332e01,
+            "OSi_g": 8.273579821046055e-01,
+            "OSi_g_activity": 8.273579821046055e-01,
+        },
+    ),
+    "subNeptune_O7.0": (
+        subneptune,
+        7.0e24,
+        {
+            "H2O_g": 4.477789711513712e05,
+            "H2_g": 3.463824822645956e-02,
+            "H2_g_activity": 4.081150539627139e02,
+            "O2_g": 2.597033179470946e04,
+        },
+    ),
+    "subNeptune_O7.5": (
+        subneptune,
+        7.5e24,
+        {
+            "H2O_g": 4.785890592398898e05,
+            "H2_g": 7.208115634579626e-03,
+            "H2_g_activity": 2.445386584856476e02,
+            "O2_g": 8.263153509596182e04,
+        },
+    ),
+    "subNeptune_O8.0": (
+        subneptune,
+        8.0e24,
+        {
+            "H2O_g": 5.039107471956282e05,
+            "H2_g": 2.129125602157067e-03,
+            "H2_g_activity": 1.945159917637966e02,
+            "O2_g": 1.447811285078976e05,
+        },
+    ),
+}
+"""Cases with the H2 EOS from :cite:t:`CD21` given as (planet, O mass in kg, target)"""
+
+
+@pytest.fixture(scope="module")
+def chabrier_solution(subneptune_system: InteriorAtmosphere) -> dict[str, ArrayLike]:
+    """Solves all the :cite:t:`CD21` cases in a single batch
+
+    The cases share the same species so stacking the planets and mass constraints along a leading
+    batch axis means the solver is only compiled and run once for all cases.
     """
-
-    surface_temperature = 3400  # K
-    planet_mass = 4.6 * 5.97224e24  # kg
-    surface_radius = 1.5 * 6371000  # m
-    planet: Planet = Planet(
-        surface_temperature=surface_temperature,
-        planet_mass=planet_mass,
-        surface_radius=surface_radius,
-    )
-    h_kg: ArrayLike = 0.01 * planet.planet_mass
-    si_kg: ArrayLike = 0.1459 * planet.planet_mass  # Si = 14.59 wt% Kargel & Lewis (1993)
-    o_kg: ArrayLike = 6.74717e24
+    planets: list[Planet] = [planet for planet, _, _ in CHABRIER_CASES.values()]
+    planet: Planet = jax.tree.map(lambda *xs: jnp.stack(xs), *planets)
+    h_kg: Array = CHABRIER_H_MASS_FRACTION * planet.planet_mass
+    si_kg: Array = CHABRIER_SI_MASS_FRACTION * planet.planet_mass
+    o_kg: NpFloat = np.array([o_kg for _, o_kg, _ in CHABRIER_CASES.values()])
 
     logger.info("h_kg = %s", h_kg)
     logger.info("si_kg = %s", si_kg)
@@ -160,69 +215,30 @@ def test_chabrier_subNeptune(helper) -> None:
 
     subneptune_system.solve(planet=planet, mass_constraints=mass_constraints)
     output: Output = subneptune_system.output
-    solution: dict[str, ArrayLike] = output.quick_look()
-
-    target: dict[str, float] = {
-        "H2O_g": 4.295071823974879e05,
-        "H2O_g_activity": 4.295071823974879e05,
-        "H2_g": 2.926773356736283e00,
-        "H2_g_activity": 1.956449985411128e04,
-        "H4Si_g": 7.038499826508187e-04,
-        "H4Si_g_activity": 7.038499826508187e-04,
-        "O2Si_l": 4.497910721606553e05,
-        "O2Si_l_activity": 1.0,
-        "O2_g": 1.039725511931324e01,
-        "O2_g_activity": 1.039725511931332e01,
-        "OSi_g": 8.273579821046055e-01,
-        "OSi_g_activity": 8.273579821046055e-01,
-    }
-
-    assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
-
 
-def test_chabrier_subNeptune_batch(helper) -> None:
-    """Tests a system with the H2 EOS from :cite:t:`CD21` for a sub-Neptune for several O masses
+    return output.quick_look()
 
-    As above, this test has questionable physical relevance without the inclusion of more species'
-    solubility, but it serves its purpose as a test.
-    """
-
-    surface_temperature = 3400  # K
-    planet_mass = 4.6 * 5.97224e24  # kg
-    surface_radius = 1.5 * 6371000  # m
-    planet: Planet = Planet(
-        surface_temperature=surface_temperature,
-        planet_mass=planet_mass,
-        surface_radius=surface_radius,
-    )
-    h_kg: ArrayLike = 0.01 * planet.planet_mass
-    si_kg: ArrayLike = 0.1459 * planet.planet_mass  # Si = 14.59 wt% Kargel & Lewis (1993)
-    # Batch solve for three oxygen masses
-    o_kg: ArrayLike = 1e24 * np.array([7.0, 7.5, 8.0])
 
-    logger.info("h_kg = %s", h_kg)
-    logger.info("si_kg = %s", si_kg)
-    logger.info("o_kg = %s", o_kg)
-
-    mass_constraints: dict[str, ArrayLike] = {"H": h_kg, "Si": si_kg, "O": o_kg}
-
-    subneptune_system.solve(planet=planet, mass_constraints=mass_constraints)
-    output: Output = subneptune_system.output
-    solution: dict[str, ArrayLike] = output.quick_look()
+@pytest.mark.xdist_group("chabrier")
+@pytest.mark.parametrize("case", CHABRIER_CASES.keys())
+def test_chabrier(helper, chabrier_solution, case: str) -> None:
+    """Tests a system with the H2 EOS from :cite:t:`CD21` for an Earth and sub-Neptune"""
 
-    target: dict[str, ArrayLike] = {
-        "H2O_g": np.array([4.477789711513712e05, 4.785890592398898e05, 5.039107471956282e05]),
-        "H2_g": np.array([3.463824822645956e-02, 7.208115634579626e-03, 2.129125602157067e-03]),
-        "H2_g_activity": np.array(
-            [4.081150539627139e02, 2.445386584856476e02, 1.945159917637966e02]
-        ),
-        "O2_g": np.array([2.597033179470946e04, 8.263153509596182e04, 1.447811285078976e05]),
+    index: int = list(CHABRIER_CASES).index(case)
+    solution: dict[str, ArrayLike] = {
+        key: np.asarray(value)[index] for key, value in chabrier_solution.items()
     }
+    target: dict[str, float] = CHABRIER_CASES[case][2]
 
     assert helper.isclose(solution, target, rtol=RTOL, atol=ATOL)
 
 
-def test_pH2_fO2_real_gas(helper) -> None:
+@pytest.mark.xdist_group("cork")
+def test_pH2_fO2_real_gas(
+    helper,
+    eos_models: Mapping[str, ActivityProtocol],
+    solubility_models: Mapping[str, SolubilityProtocol],
+) -> None:
     """Tests H2-H2O at the IW buffer using real gas EOS from :cite:t:`HP91,HP98`.
 
     Applies a constraint to the fugacity of H2.
@@ -262,7 +278,12 @@ def test_pH2_fO2_real_gas(helper) -> None:
 
 
 @pytest.mark.skip(reason="Complicated test that can fail if multistart is not large enough")
-def test_H_and_C_real_gas(helper) -> None:
+@pytest.mark.xdist_group("cork")
+def test_H_and_C_real_gas(
+    helper,
+    eos_models: Mapping[str, ActivityProtocol],
+    solubility_models: Mapping[str, SolubilityProtocol],
+) -> None:
     """Tests H2-H2O-O2-CO-CO2-CH4 at the IW buffer using real gas EOS from :cite:t:`HP91,HP98`."""
 
     H2_g: Species = Species.create_gas(
@@ -293,9 +314,7 @@ def test_H_and_C_real_gas(helper) -> None:
         "O2_g": ConstantFugacityConstraint(1.0132255325169718e-07),
     }
 
-    oceans: ArrayLike = 10
-    h_kg: ArrayLike = earth_oceans_to_hydrogen_mass(oceans)
-    c_kg: ArrayLike = h_kg
+    c_kg: float = 10 * H_KG_PER_OCEAN
     mass_constraints: dict[str, ArrayLike] = {"C": c_kg}
 
     solver_parameters = SolverParameters(multistart=5)